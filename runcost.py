@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 """RunCost CLI — GitHub Actions cost analysis & optimization."""
 import argparse
+import heapq
 import json
 import os
 import sys
+from datetime import date, time
 
-from engine import Client, analyze, validate_repo
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 
 def mask_token(token):
@@ -15,30 +20,81 @@ def mask_token(token):
     return "****"
 
 
-def print_table(workflows):
-    """Print cost breakdown table."""
+_WF_ROW = "     Runs: {}  |  Minutes: {:.1f}  |  Cost: ${:.2f}\n".format
+_JOB_ROW = "       \u2514\u2500 {}: {} runs, {:.1f}min, ${:.2f}\n".format
+_WF_MORE = "\n  \u2026 and {} more workflow{} (use --top)\n".format
+_JOB_MORE = "       \u2026 and {} more job{} (use --top)\n".format
+
+
+def _plural(n):
+    return "" if n == 1 else "s"
+
+
+def _top(items, n):
+    """Return the n most expensive (name, entry) pairs, highest cost first."""
+    return heapq.nlargest(n, items, key=lambda x: x[1]["cost"])
+
+
+def print_table(workflows, buf, top=20):
+    """Append cost breakdown table lines to buf, limited to the `top` costliest rows."""
     if not workflows:
-        print("  (no workflow data)")
+        buf.append("  (no workflow data)\n")
+        return
+    for name, wf in _top(workflows.items(), top):
+        buf.append(f"\n  \U0001f4e6 {name}\n")
+        buf.append(_WF_ROW(wf["runs"], wf["minutes"], wf["cost"]))
+        jobs = wf.get("jobs", {})
+        for jn, j in _top(jobs.items(), top):
+            buf.append(_JOB_ROW(jn, j["count"], j["minutes"], j["cost"]))
+        hidden = len(jobs) - top
+        if hidden > 0:
+            buf.append(_JOB_MORE(hidden, _plural(hidden)))
+    hidden = len(workflows) - top
+    if hidden > 0:
+        buf.append(_WF_MORE(hidden, _plural(hidden)))
+
+
+def _json_default(obj):
+    """Encode values JSON has no type for; dates/times as ISO 8601."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_json(result):
+    """Write the analysis result to stdout as indented JSON.
+
+    Both encoders emit ISO 8601 dates/times and UTF-8 text. orjson, used when
+    installed, spells some floats differently (0.00006666666666666667 rather
+    than 6.666666666666667e-05) and writes NaN as null; values are equal.
+    """
+    if orjson is None:
+        print(json.dumps(result, indent=2, ensure_ascii=False, default=_json_default))
+        return
+    data = orjson.dumps(result, default=_json_default,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:  # text-only stdout, e.g. redirect_stdout(io.StringIO())
+        sys.stdout.write(data.decode() + "\n")
         return
-    for name, wf in sorted(workflows.items(), key=lambda x: -x[1]["cost"]):
-        print(f"\n  \U0001f4e6 {name}")
-        print(f"     Runs: {wf['runs']}  |  Minutes: {wf['minutes']:.1f}  |  Cost: ${wf['cost']:.2f}")
-        for jn, j in sorted(wf.get("jobs", {}).items(), key=lambda x: -x[1]["cost"]):
-            print(f"       \u2514\u2500 {jn}: {j['count']} runs, {j['minutes']:.1f}min, ${j['cost']:.2f}")
+    sys.stdout.flush()
+    out.write(data + b"\n")
+    out.flush()
 
 
-def print_recs(recs):
-    """Print optimization recommendations."""
+def print_recs(recs, buf):
+    """Append optimization recommendation lines to buf."""
     if not recs:
-        print("  \u2705 No optimization issues found — your CI is lean!")
+        buf.append("  \u2705 No optimization issues found — your CI is lean!\n")
         return
     icons = {"expensive_workflow": "\U0001f4b8", "long_job": "\U0001f40c", "high_frequency": "\U0001f504"}
+    warn = "\u26a0\ufe0f"
     for r in recs:
         label = r.get("workflow", "")
         if "job" in r:
             label += f" / {r['job']}"
-        print(f"  {icons.get(r['type'], '\u26a0\ufe0f')} [{r['type']}] {label}")
-        print(f"     {r['fix']}")
+        buf.append(f"  {icons.get(r['type'], warn)} [{r['type']}] {label}\n")
+        buf.append(f"     {r['fix']}\n")
 
 
 def main():
@@ -47,13 +103,21 @@ def main():
     parser.add_argument("--token", default=os.environ.get("GITHUB_TOKEN"),
                         help="GitHub token (or set GITHUB_TOKEN env)")
     parser.add_argument("--limit", type=int, default=50, help="Max runs to analyze (default: 50)")
+    parser.add_argument("--top", type=int, default=20,
+                        help="Show only the N most expensive workflows/jobs (default: 20)")
     parser.add_argument("--json", dest="as_json", action="store_true", help="Output JSON")
     parser.add_argument("--api-url", default="https://api.github.com", help=argparse.SUPPRESS)
     args = parser.parse_args()
+    if args.top < 1:
+        parser.error("--top must be at least 1")
 
     if not args.token:
         print("\u274c Set GITHUB_TOKEN env or use --token", file=sys.stderr)
         sys.exit(1)
+
+    # Deferred so --help and usage errors don't pay for importing the HTTP stack.
+    from engine import Client, analyze, validate_repo
+
     try:
         validate_repo(args.repo)
     except ValueError as e:
@@ -71,25 +135,29 @@ def main():
         sys.exit(1)
 
     if args.as_json:
-        print(json.dumps(result, indent=2, default=str))
+        write_json(result)
         return
 
     sep = "=" * 52
-    print(f"\n{sep}")
-    print(f"  RunCost Report \u2014 {args.repo}")
-    print(sep)
-    print(f"  Total runs analyzed: {result['total_runs']}")
-    print(f"  Total estimated cost: ${result['total_cost']:.2f}")
-    print(f"\n{'\u2500' * 52}")
-    print("  \U0001f4ca Cost Breakdown by Workflow")
-    print_table(result["workflows"])
-    print(f"\n{'\u2500' * 52}")
-    print("  \U0001f4a1 Optimization Recommendations")
-    print_recs(result["recommendations"])
-    print(f"{sep}")
-    print("  \U0001f680 RunCost Pro: Slack alerts, budget enforcement,")
-    print("     anomaly detection. https://runcost.dev/pricing")
-    print(f"{sep}\n")
+    rule = "\u2500" * 52
+    buf = [
+        f"\n{sep}\n",
+        f"  RunCost Report \u2014 {args.repo}\n",
+        f"{sep}\n",
+        f"  Total runs analyzed: {result['total_runs']}\n",
+        f"  Total estimated cost: ${result['total_cost']:.2f}\n",
+        f"\n{rule}\n",
+        "  \U0001f4ca Cost Breakdown by Workflow\n",
+    ]
+    print_table(result["workflows"], buf, args.top)
+    buf.append(f"\n{rule}\n")
+    buf.append("  \U0001f4a1 Optimization Recommendations\n")
+    print_recs(result["recommendations"], buf)
+    buf.append(f"{sep}\n")
+    buf.append("  \U0001f680 RunCost Pro: Slack alerts, budget enforcement,\n")
+    buf.append("     anomaly detection. https://runcost.dev/pricing\n")
+    buf.append(f"{sep}\n\n")
+    sys.stdout.write("".join(buf))
 
 
 if __name__ == "__main__":
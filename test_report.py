@@ -0,0 +1,116 @@
+"""Tests for RunCost report rendering — no engine/network required."""
+import io
+import json
+from contextlib import redirect_stdout
+from datetime import date, datetime, timezone
+
+import pytest
+
+import runcost
+from runcost import print_recs, print_table, write_json
+
+
+class TestPrintTable:
+    def test_top_limits_rows_most_expensive_first(self):
+        wfs = {
+            "lint": {"runs": 1, "minutes": 1, "cost": 0.1, "jobs": {}},
+            "deploy": {"runs": 1, "minutes": 9, "cost": 5.0, "jobs": {}},
+            "ci": {"runs": 1, "minutes": 5, "cost": 1.0, "jobs": {}},
+        }
+        buf = []
+        print_table(wfs, buf, top=2)
+        out = "".join(buf)
+        assert "lint" not in out
+        assert out.index("deploy") < out.index("ci")
+        assert out.endswith("\n  \u2026 and 1 more workflow (use --top)\n")
+
+    def test_top_applies_to_jobs(self):
+        wfs = {"ci": {"runs": 1, "minutes": 5, "cost": 1.0, "jobs": {
+            "build": {"count": 1, "minutes": 4, "cost": 0.8},
+            "lint": {"count": 1, "minutes": 1, "cost": 0.2},
+        }}}
+        buf = []
+        print_table(wfs, buf, top=1)
+        out = "".join(buf)
+        assert "build" in out and "lint" not in out
+        assert "       \u2026 and 1 more job (use --top)\n" in out
+
+    def test_more_line_pluralizes(self):
+        wfs = {n: {"runs": 1, "minutes": 1, "cost": c, "jobs": {}}
+               for n, c in (("a", 3.0), ("b", 2.0), ("c", 1.0))}
+        buf = []
+        print_table(wfs, buf, top=1)
+        assert "".join(buf).endswith("\n  \u2026 and 2 more workflows (use --top)\n")
+
+    def test_no_more_line_when_all_rows_fit(self):
+        wfs = {"ci": {"runs": 1, "minutes": 5, "cost": 1.0, "jobs": {
+            "build": {"count": 1, "minutes": 4, "cost": 0.8},
+        }}}
+        buf = []
+        print_table(wfs, buf, top=1)
+        assert "more" not in "".join(buf)
+
+    def test_empty_workflows(self):
+        buf = []
+        print_table({}, buf)
+        assert buf == ["  (no workflow data)\n"]
+
+
+class TestPrintRecs:
+    def test_lines_are_newline_terminated(self):
+        buf = []
+        print_recs([{"type": "long_job", "workflow": "ci", "job": "build",
+                     "fix": "Enable caching."}], buf)
+        assert "".join(buf) == "  \U0001f40c [long_job] ci / build\n     Enable caching.\n"
+
+
+class TestJsonOutput:
+    EXPECTED = (
+        '{\n'
+        '  "generated_at": "2024-06-15T10:30:00+00:00",\n'
+        '  "started_at": "2024-06-15T10:30:00",\n'
+        '  "day": "2024-06-15",\n'
+        '  "runs": {\n'
+        '    "101": "Build \u2014 Test"\n'
+        '  },\n'
+        '  "total_cost": 0.08\n'
+        '}\n'
+    )
+    RESULT = {
+        "generated_at": datetime(2024, 6, 15, 10, 30, tzinfo=timezone.utc),
+        "started_at": datetime(2024, 6, 15, 10, 30),
+        "day": date(2024, 6, 15),
+        "runs": {101: "Build \u2014 Test"},
+        "total_cost": 0.08,
+    }
+
+    def test_stdlib_fallback(self, monkeypatch, capsys):
+        monkeypatch.setattr(runcost, "orjson", None)
+        write_json(self.RESULT)
+        assert capsys.readouterr().out == self.EXPECTED
+
+    def test_orjson(self, capsys):
+        pytest.importorskip("orjson")
+        assert runcost.orjson is not None
+        write_json(self.RESULT)
+        assert capsys.readouterr().out == self.EXPECTED
+
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_float_values_roundtrip(self, use_orjson, monkeypatch, capsys):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(runcost, "orjson", None)
+        costs = {"half_second_job": 0.008 * (0.5 / 60), "large": 1e16}
+        write_json(costs)
+        assert json.loads(capsys.readouterr().out) == costs
+
+    def test_output_is_valid_json(self, capsys):
+        write_json(self.RESULT)
+        assert json.loads(capsys.readouterr().out)["runs"] == {"101": "Build \u2014 Test"}
+
+    def test_text_only_stdout(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            write_json(self.RESULT)
+        assert out.getvalue() == self.EXPECTED